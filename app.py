@@ -1,8 +1,91 @@
+import io
 import os
 import csv
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, render_template, send_file, after_this_request
 from werkzeug.utils import secure_filename
-from email_verifier import check_syntax, check_mx_records, check_smtp
+from email_verifier import (check_mx_records, check_smtp_batch,
+                            is_always_accept_domain, parse_email)
+
+# Number of worker threads; each thread handles one domain's batch, so this
+# caps how many domains are verified in parallel.
+MAX_WORKERS = 64
+
+# Output CSV header; result rows are plain lists in this column order.
+FIELDNAMES = ['Email', 'SyntaxValid', 'DomainHasMX', 'MailboxExists', 'OverallStatus']
+
+# Result rows are emitted in chunks of this size via writerows(), which
+# loops over the batch in C instead of one Python call per row.
+WRITE_CHUNK_ROWS = 500
+
+
+def verify_domain_group(item):
+    """
+    Verify all addresses at one domain over a shared SMTP session.
+
+    Returns (domain, has_mx, {email: mailbox status}).
+    """
+    domain, addresses = item
+    mx_records = check_mx_records(domain)
+    if is_always_accept_domain(domain):
+        # These providers answer 250 for every address, so the SMTP
+        # dialogue proves nothing; skip it and say so in the result.
+        statuses = {address: "Unverifiable (catch-all provider)" for address in addresses}
+    elif mx_records:
+        statuses = check_smtp_batch(addresses, mx_records)
+    else:
+        statuses = {address: "Unverifiable" for address in addresses}
+    return domain, mx_records is not None, statuses
+
+
+def iter_verified_rows(emails):
+    """
+    Verify a batch of emails, yielding one result row per input address in
+    input order. Rows are lists in FIELDNAMES column order.
+
+    Duplicate addresses (case-insensitive) are verified once and share the
+    cached result, so a list with heavy repetition does proportionally less
+    network work. Unique addresses are bucketed by domain so one SMTP
+    session amortizes the connection handshake across every user at that
+    domain. Verification memory is proportional to the number of unique
+    addresses (plus the input list itself), and each row is emitted as soon
+    as its own domain's verification completes, so the caller can write
+    rows while slower domains are still in flight.
+    """
+    # Scraped lists commonly repeat addresses; key results by the
+    # lower-cased form and parse/verify each unique address once.
+    unique = {}
+    for email in emails:
+        key = email.lower()
+        if key not in unique:
+            unique[key] = parse_email(key)
+
+    groups = defaultdict(list)
+    for parsed in unique.values():
+        if parsed is not None:
+            groups[parsed.domain].append(parsed.raw)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # One future per domain; each row below blocks only on the future
+        # its own domain needs, so output streams in input order instead of
+        # waiting for the slowest domain in the whole batch.
+        futures = {domain: executor.submit(verify_domain_group, (domain, addresses))
+                   for domain, addresses in groups.items()}
+
+        for email in emails:
+            parsed = unique[email.lower()]
+            if parsed is not None:
+                _, has_mx, statuses = futures[parsed.domain].result()
+                mailbox_exists = statuses.get(parsed.raw, "Unverifiable")
+                if has_mx and mailbox_exists == "Exists":
+                    overall_status = "Valid"
+                else:
+                    overall_status = "Risky / Invalid"
+                yield [email, "Valid", "True" if has_mx else "False",
+                       mailbox_exists, overall_status]
+            else:
+                yield [email, "Invalid", "False", "Unverifiable", "Invalid Syntax"]
 
 # Initialize the Flask app
 app = Flask(__name__)
@@ -26,72 +109,55 @@ def verify_emails():
         return "No selected file", 400
 
     if file and file.filename.endswith('.csv'):
-        # Save the uploaded file securely
         filename = secure_filename(file.filename)
-        input_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(input_path)
 
         # Prepare the output file path
         output_filename = f"results_{filename}"
         output_path = os.path.join(app.config['UPLOAD_FOLDER'], output_filename)
 
-        results = []
         try:
-            with open(input_path, mode='r', newline='', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                if 'Email' not in reader.fieldnames:
-                    return "Error: Input CSV must contain an 'Email' column.", 400
-                
-                # --- This is the verification logic from your original main.py ---
-                for row in reader:
-                    email = row['Email'].strip()
-                    syntax_valid = check_syntax(email)
-                    domain_has_mx = False
-                    mailbox_exists = "Unverifiable"
-                    
-                    if syntax_valid:
-                        domain = email.split('@')[1]
-                        mx_records = check_mx_records(domain)
-                        if mx_records:
-                            domain_has_mx = True
-                            mailbox_exists = check_smtp(email, mx_records)
-
-                        if domain_has_mx and mailbox_exists == "Exists":
-                            overall_status = "Valid"
-                        else:
-                            overall_status = "Risky / Invalid"
-                    else:
-                        overall_status = "Invalid Syntax"
-
-                    results.append({
-                        'Email': email,
-                        'SyntaxValid': "Valid" if syntax_valid else "Invalid",
-                        'DomainHasMX': "True" if domain_has_mx else "False",
-                        'MailboxExists': mailbox_exists,
-                        'OverallStatus': overall_status
-                    })
+            # Read the upload straight off the request stream; the input is
+            # never written to disk or held in memory as a whole.
+            stream = io.TextIOWrapper(file.stream, encoding='utf-8', newline='')
+            # Plain csv.reader with a fixed column index avoids the
+            # per-row dict that DictReader allocates.
+            reader = csv.reader(stream)
+            header = next(reader, None)
+            if header is None or 'Email' not in header:
+                return "Error: Input CSV must contain an 'Email' column.", 400
+            email_idx = header.index('Email')
+
+            emails = [row[email_idx].strip() for row in reader if row]
+
+            # Stream results into the output CSV as they are produced, so
+            # memory stays flat and the file starts filling immediately.
+            with open(output_path, mode='w', newline='', encoding='utf-8') as outfile:
+                writer = csv.writer(outfile)
+                writer.writerow(FIELDNAMES)
+                buffer = []
+                for row in iter_verified_rows(emails):
+                    buffer.append(row)
+                    if len(buffer) >= WRITE_CHUNK_ROWS:
+                        writer.writerows(buffer)
+                        buffer.clear()
+                        outfile.flush()
+                if buffer:
+                    writer.writerows(buffer)
         except Exception as e:
             return f"An error occurred: {e}", 500
-        
-        # Write results to the output CSV
-        with open(output_path, mode='w', newline='', encoding='utf-8') as outfile:
-            fieldnames = ['Email', 'SyntaxValid', 'DomainHasMX', 'MailboxExists', 'OverallStatus']
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
-
-        # Clean up the files after the request is finished
+
+        # Clean up the results file after the request is finished
         @after_this_request
         def cleanup(response):
             try:
-                os.remove(input_path)
                 os.remove(output_path)
             except Exception as error:
                 app.logger.error("Error removing or cleaning up file: %s", error)
             return response
 
         # Send the results file to the user for download
-        return send_file(output_path, as_attachment=True, download_name=output_filename)
+        return send_file(output_path, as_attachment=True, download_name=output_filename,
+                         conditional=True)
 
     return "Invalid file type. Please upload a CSV.", 400
 
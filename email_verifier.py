@@ -1,8 +1,104 @@
+import asyncio
+import json
+import logging
 import re
+import sqlite3
+import threading
+import time
+import weakref
+import dns.asyncresolver
 import dns.resolver
 import smtplib
 import socket
-from typing import List, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Faster IDNA 2008 encoder than the stdlib codec; optional.
+    import idna
+except ImportError:
+    idna = None
+
+logger = logging.getLogger(__name__)
+
+# In-memory MX cache shared across threads: ascii domain -> (mx hosts, expiry).
+# Entries honor the DNS record TTL, capped so stale data can't linger too long.
+# Negative results (None) are cached briefly to avoid re-hammering broken domains.
+_MX_CACHE: Dict[str, Tuple[Optional[List[str]], float]] = {}
+_MX_CACHE_LOCK = threading.Lock()
+_MX_CACHE_MAX_TTL = 900  # 15 minutes
+_MX_CACHE_NEGATIVE_TTL = 60
+_MX_CACHE_MISS = object()  # sentinel: None is a valid (negative) cached value
+
+# Disk-backed layer under the in-memory cache so repeat batches don't start
+# cold after a restart. Expiry here is wall-clock time, since monotonic
+# timestamps don't survive the process.
+_MX_DB_PATH = 'mx_cache.db'
+_MX_DB_LOCK = threading.Lock()
+try:
+    _MX_DB = sqlite3.connect(_MX_DB_PATH, check_same_thread=False)
+    _MX_DB.execute(
+        "CREATE TABLE IF NOT EXISTS mx (domain TEXT PRIMARY KEY, hosts TEXT, expiry REAL)")
+    _MX_DB.commit()
+except sqlite3.Error as _e:
+    logger.debug("MX disk cache unavailable: %s", _e)
+    _MX_DB = None
+
+
+def _mx_disk_get(ascii_domain: str) -> Optional[Tuple[Optional[List[str]], float]]:
+    """Return (hosts, remaining ttl) from the disk cache, or None on miss."""
+    if _MX_DB is None:
+        return None
+    try:
+        with _MX_DB_LOCK:
+            row = _MX_DB.execute(
+                "SELECT hosts, expiry FROM mx WHERE domain = ?", (ascii_domain,)).fetchone()
+    except sqlite3.Error as e:
+        logger.debug("MX disk cache read failed for %s: %s", ascii_domain, e)
+        return None
+    if row is None:
+        return None
+    hosts_json, expiry = row
+    remaining = expiry - time.time()
+    if remaining <= 0:
+        return None
+    hosts = json.loads(hosts_json) if hosts_json is not None else None
+    return hosts, remaining
+
+
+def _mx_disk_put(ascii_domain: str, hosts: Optional[List[str]], ttl: float) -> None:
+    """Upsert an MX result into the disk cache; failures are non-fatal."""
+    if _MX_DB is None:
+        return
+    try:
+        with _MX_DB_LOCK:
+            _MX_DB.execute(
+                "INSERT OR REPLACE INTO mx (domain, hosts, expiry) VALUES (?, ?, ?)",
+                (ascii_domain,
+                 json.dumps(hosts) if hosts is not None else None,
+                 time.time() + ttl))
+            _MX_DB.commit()
+    except sqlite3.Error as e:
+        logger.debug("MX disk cache write failed for %s: %s", ascii_domain, e)
+
+
+# Shared resolvers, configured once at import. Building a Resolver per call
+# re-reads /etc/resolv.conf each time; dnspython documents query operations
+# as thread-safe once configuration is done.
+_RESOLVER = dns.resolver.Resolver()
+_RESOLVER.timeout = 5.0
+_RESOLVER.lifetime = 10.0
+
+_ASYNC_RESOLVER = dns.asyncresolver.Resolver()
+_ASYNC_RESOLVER.timeout = 5.0
+_ASYNC_RESOLVER.lifetime = 10.0
+
+# Compiled once at import; avoids the re-cache lookup on every call when
+# validating large batches.
+_EMAIL_RE = re.compile(
+    r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+$"
+)
 
 
 def check_syntax(email: str) -> bool:
@@ -13,34 +109,112 @@ def check_syntax(email: str) -> bool:
     - This uses a pragmatic regex suitable for most real-world addresses.
     - It does not attempt to fully implement RFC 5322 (which is intentionally very permissive).
     """
-    regex = r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+$"
-    return re.match(regex, email) is not None
+    return _EMAIL_RE.match(email) is not None
+
+
+@dataclass(slots=True)
+class ParsedEmail:
+    """An address parsed once at ingestion: raw form, local part, ASCII domain."""
+    raw: str
+    local: str
+    domain: str
+
+
+def parse_email(raw: str) -> Optional['ParsedEmail']:
+    """
+    Validate an address and split it into structured form, normalizing the
+    domain to ASCII.
+
+    Returns None when the address fails the syntax check, so callers can
+    branch once at ingestion instead of re-splitting, re-validating and
+    re-encoding the same string on every downstream step.
+    """
+    if _EMAIL_RE.match(raw) is None:
+        return None
+    local, _, domain = raw.rpartition('@')
+    return ParsedEmail(raw, local, _normalize_domain(domain))
 
 
 def _normalize_domain(domain: str) -> str:
     """Return the ASCII (IDNA/Punycode) representation of a domain if needed."""
+    # The overwhelmingly common case is already ASCII; skip the IDNA
+    # encoder (a full stringprep pass in the stdlib codec) entirely.
+    if domain.isascii():
+        return domain.lower()
     try:
+        if idna is not None:
+            return idna.encode(domain).decode('ascii')
         return domain.encode("idna").decode("ascii")
     except Exception:
         return domain
 
 
+def _cache_mx_result(ascii_domain: str, hosts: Optional[List[str]], ttl: float) -> Optional[List[str]]:
+    """Store an MX lookup result (positive or negative) and return it."""
+    with _MX_CACHE_LOCK:
+        _MX_CACHE[ascii_domain] = (hosts, time.monotonic() + ttl)
+    _mx_disk_put(ascii_domain, hosts, ttl)
+    return hosts
+
+
+def _lookup_cached_mx(ascii_domain: str):
+    """
+    Check the in-memory cache, then the disk cache, for an unexpired MX
+    result. Disk hits are promoted into memory for the remaining TTL.
+    Returns the cached hosts (possibly None) or _MX_CACHE_MISS.
+    """
+    with _MX_CACHE_LOCK:
+        cached = _MX_CACHE.get(ascii_domain)
+    if cached is not None:
+        hosts, expiry = cached
+        if time.monotonic() < expiry:
+            return hosts
+
+    disk = _mx_disk_get(ascii_domain)
+    if disk is not None:
+        hosts, remaining = disk
+        with _MX_CACHE_LOCK:
+            _MX_CACHE[ascii_domain] = (hosts, time.monotonic() + remaining)
+        return hosts
+
+    return _MX_CACHE_MISS
+
+
+def _a_record_fallback(ascii_domain: str) -> Optional[List[str]]:
+    """
+    RFC 5321 §5.1: a domain with no MX records but an A record is treated as
+    its own implicit mail exchanger (preference 0). Caches either outcome.
+    """
+    try:
+        answers = _RESOLVER.resolve(ascii_domain, 'A')
+        ttl = min(answers.rrset.ttl, _MX_CACHE_MAX_TTL)
+        return _cache_mx_result(ascii_domain, [ascii_domain], ttl)
+    except Exception:
+        return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
+
+
 def check_mx_records(domain: str) -> Optional[List[str]]:
     """
-    Confirm that the domain has valid Mail Exchange (MX) records.
+    Confirm that the domain can receive mail via its Mail Exchange (MX)
+    records, falling back to the domain's own A record when no MX exists
+    (an implicit MX per RFC 5321 §5.1).
+
+    Results are cached in memory (keyed by ASCII domain) for the DNS record's
+    TTL, so a CSV full of addresses at the same provider triggers one lookup.
 
     Returns a list of MX hostnames sorted by priority (lowest first), or None if:
-    - The domain has no MX records,
+    - The domain has neither MX nor A records,
     - The domain publishes a "Null MX" (exchange='.' per RFC 7505), or
     - DNS lookup fails/times out.
     """
-    try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 5.0
-        resolver.lifetime = 10.0
-        ascii_domain = _normalize_domain(domain)
+    ascii_domain = _normalize_domain(domain)
 
-        answers = resolver.resolve(ascii_domain, 'MX')
+    cached = _lookup_cached_mx(ascii_domain)
+    if cached is not _MX_CACHE_MISS:
+        return cached
+
+    try:
+        answers = _RESOLVER.resolve(ascii_domain, 'MX')
         mx_entries = []
         for rdata in answers:
             # rdata.exchange is a dns.name.Name; convert to str and strip the trailing dot
@@ -52,17 +226,219 @@ def check_mx_records(domain: str) -> Optional[List[str]]:
             mx_entries.append((preference, exchange))
 
         if not mx_entries:
-            return None
+            # Null MX only: the domain explicitly refuses mail, no fallback
+            return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
 
         # Sort by MX preference (lower value = higher priority)
         mx_entries.sort(key=lambda x: x[0])
-        return [host for _, host in mx_entries]
+        ttl = min(answers.rrset.ttl, _MX_CACHE_MAX_TTL)
+        return _cache_mx_result(ascii_domain, [host for _, host in mx_entries], ttl)
 
-    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.resolver.Timeout):
-        return None
+    except dns.resolver.NoAnswer:
+        return _a_record_fallback(ascii_domain)
+    except (dns.resolver.NXDOMAIN, dns.resolver.Timeout):
+        return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
     except Exception as e:
-        print(f"Error checking MX records for {domain}: {e}")
-        return None
+        logger.debug("Error checking MX records for %s: %s", domain, e)
+        return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
+
+
+# Major providers that accept RCPT TO for any address to block mailbox
+# enumeration; probing them costs a full SMTP dialogue and proves nothing.
+_ALWAYS_ACCEPT = frozenset({
+    "gmail.com", "googlemail.com",
+    "outlook.com", "hotmail.com", "live.com", "msn.com",
+    "yahoo.com", "ymail.com",
+    "aol.com",
+    "icloud.com", "me.com", "mac.com",
+    "protonmail.com", "proton.me",
+})
+
+
+def is_always_accept_domain(domain: str) -> bool:
+    """Return True if SMTP probes against this domain are known to be meaningless."""
+    return domain.lower() in _ALWAYS_ACCEPT
+
+
+# Recipients to probe on one SMTP session before reconnecting; long-lived
+# sessions with many RCPTs start looking like abuse to receiving servers.
+_SMTP_BATCH_MAX_RCPTS = 100
+
+# Concurrent connections allowed per MX hostname. Hitting one provider with
+# many parallel sessions draws "421 too many connections" responses and
+# tarpitting, which slows the whole batch more than the cap does.
+_HOST_CONNECTION_LIMIT = 2
+_HOST_SEMAPHORES: Dict[str, threading.Semaphore] = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+# asyncio primitives are bound to one event loop, and the app runs one loop
+# per request; weak keying lets each loop's semaphores die with the loop.
+_ASYNC_HOST_SEMAPHORES: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = \
+    weakref.WeakKeyDictionary()
+
+
+def _host_semaphore(mx_host: str) -> threading.Semaphore:
+    """Return the shared semaphore bounding concurrent sessions to one MX host."""
+    # Zones publish MX targets in arbitrary case; fold so variants share a cap
+    key = mx_host.lower()
+    with _HOST_SEMAPHORES_LOCK:
+        sem = _HOST_SEMAPHORES.get(key)
+        if sem is None:
+            sem = _HOST_SEMAPHORES[key] = threading.Semaphore(_HOST_CONNECTION_LIMIT)
+        return sem
+
+
+def _async_host_semaphore(mx_host: str) -> asyncio.Semaphore:
+    """Async counterpart of _host_semaphore, scoped to the running event loop."""
+    loop = asyncio.get_running_loop()
+    loop_semaphores = _ASYNC_HOST_SEMAPHORES.get(loop)
+    if loop_semaphores is None:
+        loop_semaphores = _ASYNC_HOST_SEMAPHORES[loop] = {}
+    key = mx_host.lower()
+    sem = loop_semaphores.get(key)
+    if sem is None:
+        sem = loop_semaphores[key] = asyncio.Semaphore(_HOST_CONNECTION_LIMIT)
+    return sem
+
+# Per-server timeouts. A domain may list a dozen MX hosts that all drop our
+# connection; 5s each keeps the worst case bounded instead of 10s per host.
+SMTP_CONNECT_TIMEOUT = 5
+SMTP_CMD_TIMEOUT = 5
+
+# HELO hostname and neutral MAIL FROM sender, computed once at import.
+# getfqdn() does a reverse-DNS lookup that can block for seconds on
+# misconfigured hosts, so it must not run once per verification.
+try:
+    _LOCAL_HELO = socket.getfqdn() or 'localhost'
+except Exception:
+    _LOCAL_HELO = 'localhost'
+# Use a neutral sender. Some servers validate the sender domain too.
+_SENDER = f"no-reply@{_LOCAL_HELO.split('.', 1)[-1] or 'localhost'}"
+
+
+def _open_smtp_session(mx_host: str) -> smtplib.SMTP:
+    """
+    Connect to an MX and bring the session to the point where envelope
+    commands can be issued: EHLO, upgrading via STARTTLS when offered.
+
+    Raises smtplib.SMTPException or socket.error if the session cannot be
+    established; the caller decides whether to try the next MX host.
+    """
+    server = smtplib.SMTP(mx_host, 25, timeout=SMTP_CONNECT_TIMEOUT)
+    try:
+        # The constructor timeout covers connect; commands get their own budget
+        server.sock.settimeout(SMTP_CMD_TIMEOUT)
+        code, _ = server.ehlo()
+        if 200 <= code < 300 and server.has_extn('starttls'):
+            # Attempt to upgrade to TLS when available
+            try:
+                server.starttls()
+                server.ehlo()
+            except smtplib.SMTPException:
+                # If STARTTLS fails, continue without TLS
+                pass
+        else:
+            # Fallback to HELO if EHLO not accepted
+            server.helo(_LOCAL_HELO)
+
+        return server
+    except Exception:
+        try:
+            server.quit()
+        except Exception:
+            pass
+        raise
+
+
+def _probe_rcpt(server: smtplib.SMTP, sender: str, email: str) -> int:
+    """
+    Probe one mailbox on an open session and return the RCPT TO reply code,
+    leaving the envelope reset for the next recipient.
+
+    When the EHLO reply advertised PIPELINING (RFC 2920), MAIL FROM, RCPT TO
+    and RSET go out in a single TCP write and the three replies are read in
+    one burst, collapsing three round-trips into one. Otherwise the commands
+    are issued sequentially as before.
+    """
+    if server.has_extn('pipelining'):
+        server.send(f"MAIL FROM:<{sender}>\r\nRCPT TO:<{email}>\r\nRSET\r\n")
+        mail_code, mail_msg = server.getreply()
+        rcpt_code, _ = server.getreply()
+        server.getreply()  # RSET reply
+        if not 200 <= mail_code < 300:
+            raise smtplib.SMTPSenderRefused(mail_code, mail_msg, sender)
+        return rcpt_code
+
+    code, msg = server.mail(sender)
+    if not 200 <= code < 300:
+        raise smtplib.SMTPSenderRefused(code, msg, sender)
+    rcpt_code, _ = server.rcpt(email)
+    server.rset()
+    return rcpt_code
+
+
+# 250 OK / 251 user-not-local-will-forward confirm the mailbox; 550/551/553
+# are the hard "no such user" family. Everything else (4xx greylisting,
+# odd codes) is inconclusive.
+_RCPT_CODE_MAP = {250: "Exists", 251: "Exists",
+                  550: "DoesNotExist", 551: "DoesNotExist", 553: "DoesNotExist"}
+
+
+def _interpret_rcpt_code(code: int) -> str:
+    """Map an RCPT TO reply code to a mailbox status string."""
+    return _RCPT_CODE_MAP.get(code, "Unverifiable")
+
+
+def check_smtp_batch(emails_at_domain: List[str], mx_servers: List[str]) -> Dict[str, str]:
+    """
+    Verify many mailboxes at the same domain over a shared SMTP session.
+
+    Opening a fresh TCP+EHLO+STARTTLS+MAIL dialogue per address costs 3-4
+    round-trips before the RCPT even goes out. Since every address here
+    shares the domain's MX, connect once and probe each mailbox with its
+    own MAIL FROM/RCPT TO/RSET envelope (pipelined into one round-trip
+    where supported), amortizing the handshake across the whole group. The
+    session is recycled after _SMTP_BATCH_MAX_RCPTS recipients or on a
+    protocol error.
+
+    Returns {email: status} with the same status values as check_smtp;
+    addresses that could not be probed map to "Unverifiable".
+    """
+    results = {email: "Unverifiable" for email in emails_at_domain}
+    if not mx_servers or not emails_at_domain:
+        return results
+
+    pending = deque(emails_at_domain)
+
+    for mx_host in mx_servers:
+        while pending:
+            with _host_semaphore(mx_host):
+                try:
+                    server = _open_smtp_session(mx_host)
+                except (smtplib.SMTPException, socket.error) as e:
+                    logger.debug("SMTP connection error to %s: %s", mx_host, e)
+                    break  # try the next MX host with the remaining addresses
+
+                rcpt_count = 0
+                try:
+                    while pending and rcpt_count < _SMTP_BATCH_MAX_RCPTS:
+                        email = pending[0]
+                        code = _probe_rcpt(server, _SENDER, email)
+                        results[email] = _interpret_rcpt_code(code)
+                        pending.popleft()
+                        rcpt_count += 1
+                except (smtplib.SMTPException, socket.timeout, socket.error) as e:
+                    logger.debug("SMTP batch error with %s: %s", mx_host, e)
+                    break  # remaining addresses move on to the next MX host
+                finally:
+                    try:
+                        server.quit()
+                    except Exception:
+                        pass
+
+        if not pending:
+            break
+
+    return results
 
 
 def check_smtp(email: str, mx_servers: List[str]) -> str:
@@ -92,34 +468,16 @@ def check_smtp(email: str, mx_servers: List[str]) -> str:
     if not mx_servers:
         return "Unverifiable"
 
-    try:
-        local_helo = socket.getfqdn() or 'localhost'
-    except Exception:
-        local_helo = 'localhost'
-
     for mx_host in mx_servers:
-        try:
-            # Establish SMTP connection with a timeout
-            server = smtplib.SMTP(mx_host, 25, timeout=10)
+        with _host_semaphore(mx_host):
             try:
-                code, _ = server.ehlo()
-                if 200 <= code < 300 and server.has_extn('starttls'):
-                    # Attempt to upgrade to TLS when available
-                    try:
-                        server.starttls()
-                        server.ehlo()
-                    except smtplib.SMTPException:
-                        # If STARTTLS fails, continue without TLS
-                        pass
-                else:
-                    # Fallback to HELO if EHLO not accepted
-                    server.helo(local_helo)
-
-                # Use a neutral sender. Some servers validate the sender domain too.
-                sender = f"no-reply@{local_helo.split('.', 1)[-1] or 'localhost'}"
-                server.mail(sender)
+                server = _open_smtp_session(mx_host)
+            except (smtplib.SMTPException, socket.error) as e:
+                logger.debug("SMTP connection error to %s: %s", mx_host, e)
+                continue
 
-                code, message = server.rcpt(email)
+            try:
+                code = _probe_rcpt(server, _SENDER, email)
 
                 # Always try to quit cleanly; ignore errors on QUIT
                 try:
@@ -127,41 +485,162 @@ def check_smtp(email: str, mx_servers: List[str]) -> str:
                 except Exception:
                     pass
 
-                # Interpret response codes
-                if code in (250, 251):
-                    return "Exists"
-                elif code in (550, 551, 553):
-                    return "DoesNotExist"
-                elif 400 <= code < 500:
-                    return "Unverifiable"
-                else:
-                    return "Unverifiable"
-
-            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException, smtplib.SMTPHeloError) as e:
-                print(f"SMTP protocol error with {mx_host}: {e}")
+                return _interpret_rcpt_code(code)
+
+            except smtplib.SMTPResponseException as e:
+                logger.debug("SMTP protocol error with %s: %s", mx_host, e)
                 try:
                     server.quit()
                 except Exception:
                     pass
+                # A definitive 4xx/5xx answer (greylisting, policy rejection)
+                # rarely differs between a domain's MX hosts; stop here rather
+                # than paying the handshake again on every remaining server.
+                if 400 <= e.smtp_code < 600:
+                    break
+                continue
+            except (smtplib.SMTPServerDisconnected, socket.timeout, socket.error) as e:
+                logger.debug("Socket error with %s: %s", mx_host, e)
+            except Exception as e:
+                logger.debug("Unexpected SMTP error with %s: %s", mx_host, e)
+
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    return "Unverifiable"
+
+
+async def _a_record_fallback_async(ascii_domain: str) -> Optional[List[str]]:
+    """Async counterpart of _a_record_fallback (implicit MX per RFC 5321 §5.1)."""
+    try:
+        answers = await _ASYNC_RESOLVER.resolve(ascii_domain, 'A')
+        ttl = min(answers.rrset.ttl, _MX_CACHE_MAX_TTL)
+        return _cache_mx_result(ascii_domain, [ascii_domain], ttl)
+    except Exception:
+        return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
+
+
+async def check_mx_records_async(domain: str) -> Optional[List[str]]:
+    """
+    Async counterpart of check_mx_records, using dns.asyncresolver.
+
+    Shares the same in-memory TTL cache, so mixed sync/async callers benefit
+    from each other's lookups. Returns the same values as the sync version.
+    """
+    ascii_domain = _normalize_domain(domain)
+
+    cached = _lookup_cached_mx(ascii_domain)
+    if cached is not _MX_CACHE_MISS:
+        return cached
+
+    try:
+        answers = await _ASYNC_RESOLVER.resolve(ascii_domain, 'MX')
+        mx_entries = []
+        for rdata in answers:
+            exchange = str(rdata.exchange).rstrip('.')
+            preference = int(rdata.preference)
+            if exchange == '' or exchange == '.':
                 continue
-            except (socket.timeout, socket.error) as e:
-                print(f"Socket error with {mx_host}: {e}")
+            mx_entries.append((preference, exchange))
+
+        if not mx_entries:
+            # Null MX only: the domain explicitly refuses mail, no fallback
+            return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
+
+        mx_entries.sort(key=lambda x: x[0])
+        ttl = min(answers.rrset.ttl, _MX_CACHE_MAX_TTL)
+        return _cache_mx_result(ascii_domain, [host for _, host in mx_entries], ttl)
+
+    except dns.resolver.NoAnswer:
+        return await _a_record_fallback_async(ascii_domain)
+    except (dns.resolver.NXDOMAIN, dns.resolver.Timeout):
+        return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
+    except Exception as e:
+        logger.debug("Error checking MX records for %s: %s", domain, e)
+        return _cache_mx_result(ascii_domain, None, _MX_CACHE_NEGATIVE_TTL)
+
+
+_ASYNC_SMTP_TIMEOUT = 10
+
+
+async def _read_smtp_reply(reader: asyncio.StreamReader) -> int:
+    """Read one (possibly multiline) SMTP reply and return its status code."""
+    code = -1
+    while True:
+        line = await asyncio.wait_for(reader.readline(), timeout=_ASYNC_SMTP_TIMEOUT)
+        if not line:
+            raise ConnectionError("server closed the connection")
+        try:
+            code = int(line[:3])
+        except ValueError:
+            raise ConnectionError(f"malformed SMTP reply: {line!r}")
+        # A hyphen after the code marks a continuation line (e.g. "250-SIZE")
+        if len(line) < 4 or line[3:4] != b'-':
+            return code
+
+
+async def _send_smtp_command(reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter,
+                             command: str) -> int:
+    """Send one SMTP command and return the status code of the reply."""
+    writer.write(command.encode('ascii') + b'\r\n')
+    await asyncio.wait_for(writer.drain(), timeout=_ASYNC_SMTP_TIMEOUT)
+    return await _read_smtp_reply(reader)
+
+
+async def check_smtp_async(email: str, mx_servers: List[str]) -> str:
+    """
+    Async counterpart of check_smtp, speaking SMTP by hand over a plain
+    asyncio stream (EHLO, MAIL FROM, RCPT TO, QUIT — no STARTTLS upgrade).
+
+    A single event loop can hold thousands of these dialogues in flight, so
+    batch throughput is bounded by remote server latency rather than thread
+    count. Returns the same values as check_smtp.
+    """
+    if not mx_servers:
+        return "Unverifiable"
+
+    for mx_host in mx_servers:
+        writer = None
+        async with _async_host_semaphore(mx_host):
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(mx_host, 25), timeout=_ASYNC_SMTP_TIMEOUT)
+
+                code = await _read_smtp_reply(reader)  # banner
+                if not 200 <= code < 300:
+                    continue
+
+                code = await _send_smtp_command(reader, writer, f"EHLO {_LOCAL_HELO}")
+                if not 200 <= code < 300:
+                    code = await _send_smtp_command(reader, writer, f"HELO {_LOCAL_HELO}")
+                    if not 200 <= code < 300:
+                        continue
+
+                code = await _send_smtp_command(reader, writer, f"MAIL FROM:<{_SENDER}>")
+                if not 200 <= code < 300:
+                    continue
+
+                code = await _send_smtp_command(reader, writer, f"RCPT TO:<{email}>")
+
                 try:
-                    server.quit()
+                    await _send_smtp_command(reader, writer, "QUIT")
                 except Exception:
                     pass
+
+                return _interpret_rcpt_code(code)
+
+            except (asyncio.TimeoutError, ConnectionError, OSError) as e:
+                logger.debug("Async SMTP error with %s: %s", mx_host, e)
                 continue
             except Exception as e:
-                print(f"Unexpected SMTP error with {mx_host}: {e}")
-                try:
-                    server.quit()
-                except Exception:
-                    pass
+                logger.debug("Unexpected async SMTP error with %s: %s", mx_host, e)
                 continue
-
-        except (smtplib.SMTPConnectError, smtplib.SMTPException, socket.error) as e:
-            print(f"SMTP connection error to {mx_host}: {e}")
-            continue
+            finally:
+                if writer is not None:
+                    writer.close()
 
     return "Unverifiable"
 